@@ -0,0 +1,108 @@
+import decimal
+
+# Integers above this size are shown in scientific form. The full expansions are only built when copied.
+BIG_INT_BITS = 1024
+
+# Enough digits to resolve log10 of the top 128 bits of a value. Only mantissas closer than LOG_TOLERANCE
+# (relative) to an integer, i.e. values like 10**k or 2*10**k - 1, need an exact comparison.
+LOG_CONTEXT = decimal.Context(prec=60, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+LOG_TOLERANCE = decimal.Decimal('1e-30')
+
+
+def is_big_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value.bit_length() > BIG_INT_BITS
+
+
+def is_at_least(value: int, multiplier: int, k: int) -> bool:
+    """Returns value >= multiplier * 10**k exactly.
+
+    10**k is 5**k shifted by k bits, so only the smaller power 5**k is computed."""
+    return value >> k >= multiplier * 5 ** k
+
+
+def big_int_summary(value: int) -> dict:
+    """Returns the digit count and the leading digits in scientific, hex and binary form of an integer without
+    converting it to decimal.
+
+    The base 10 logarithm is computed from the bit length and the top 128 bits of the value. Leading digits are
+    truncated, never rounded."""
+    sign = '-' if value < 0 else ''
+    value = abs(value)
+    bits = value.bit_length()
+    shift = max(bits - 128, 0)
+    ctx = LOG_CONTEXT
+    log = ctx.add(ctx.log10(decimal.Decimal(value >> shift)),
+                  ctx.multiply(decimal.Decimal(shift), ctx.log10(decimal.Decimal(2))))
+    exponent = int(log.to_integral_value(rounding=decimal.ROUND_FLOOR))
+    mantissa = ctx.power(decimal.Decimal(10), ctx.subtract(log, exponent - 6))
+    nearest = int(mantissa.to_integral_value(rounding=decimal.ROUND_HALF_EVEN))
+    if abs(mantissa - nearest) < nearest * LOG_TOLERANCE:
+        # Too close to a digit boundary to trust the logarithm
+        leading = nearest if is_at_least(value, nearest, exponent - 6) else nearest - 1
+    else:
+        leading = int(mantissa.to_integral_value(rounding=decimal.ROUND_FLOOR))
+    if leading >= 10**7:
+        # Exactly at or above the next power of 10
+        leading, exponent = leading // 10, exponent + 1
+    elif leading < 10**6:
+        # Just below a power of 10, all the leading digits are 9
+        leading, exponent = leading * 10 + 9, exponent - 1
+    leading = str(leading)
+    return {
+        'sci': f'{sign}{leading[0]}.{leading[1:]}e+{exponent}',
+        'digits': exponent + 1,
+        'bits': bits,
+        'hex': f'{sign}0x{value >> ((bits + 3) // 4 - 8) * 4:X}',
+        'bin': f'{sign}0b{value >> (bits - 16):b}',
+    }
+
+
+def int_to_decimal_str(value: int) -> str:
+    """Converts an integer to decimal in subquadratic time, bypassing the int to str digit limit.
+
+    The value is split in halves on a binary boundary and recombined with ``decimal``, whose multiplication is
+    subquadratic for large operands."""
+    ctx = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+    ctx.traps[decimal.Inexact] = True
+    two = decimal.Decimal(2)
+    powers = {}
+
+    def pow2(w):
+        result = powers.get(w)
+        if result is None:
+            if w <= BIG_INT_BITS:
+                result = ctx.power(two, w)
+            elif w - 1 in powers:
+                result = ctx.add(powers[w - 1], powers[w - 1])
+            else:
+                result = ctx.multiply(pow2(w >> 1), pow2(w - (w >> 1)))
+            powers[w] = result
+        return result
+
+    def convert(n, w):
+        if w <= BIG_INT_BITS:
+            return decimal.Decimal(n)
+        w2 = w >> 1
+        hi = n >> w2
+        lo = n - (hi << w2)
+        return ctx.add(ctx.multiply(convert(hi, w - w2), pow2(w2)), convert(lo, w2))
+
+    sign = '-' if value < 0 else ''
+    value = abs(value)
+    return sign + ctx.to_eng_string(convert(value, value.bit_length()))
+
+
+def format_big_int(value: int, base: str) -> str:
+    """Full expansion of a big integer for the clipboard. base is one of 'dec', 'hex' or 'bin'.
+
+    'dec' is grouped by thousands like the context menu entry of smaller integers, 'hex' and 'bin' are not grouped."""
+    if base == 'hex':
+        return f'0x{value:X}' if value >= 0 else f'-0x{-value:X}'
+    if base == 'bin':
+        return f'0b{value:b}' if value >= 0 else f'-0b{-value:b}'
+    digits = int_to_decimal_str(value)
+    sign = '-' if digits.startswith('-') else ''
+    digits = digits.lstrip('-')
+    first_group = len(digits) % 3 or 3
+    groups = [digits[:first_group]] + [digits[i:i+3] for i in range(first_group, len(digits), 3)]
+    return sign + ' '.join(groups)
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import hashlib
 import os
 import traceback
 from math import atan2, degrees
@@ -9,6 +10,7 @@ except ImportError:
     pyperclip = None
 
 import math_parser
+from formatting import is_big_int, big_int_summary, int_to_decimal_str, format_big_int
 
 x = None
 
@@ -20,6 +22,9 @@ if pyperclip is not None:
 
 xFilePath = os.environ['TMP'] + os.sep + "wox_pycalc_x.txt"
 
+# Maximum length of a cmd.exe command line, used by the clipboard workaround
+CLIP_COMMAND_LIMIT = 8191
+
 if x is None:
     if os.path.exists(xFilePath):
         try:
@@ -44,6 +49,11 @@ def write_to_x(result):
         pass
 
 
+def x_fingerprint():
+    # x can be a very long number after storing a big integer, so only this short token is sent through JSON
+    return hashlib.sha1(str(x).encode()).hexdigest()[:16]
+
+
 def to_eng(value):
     e = 0
     p = 1
@@ -130,6 +140,19 @@ def calculate(query):
                     'dontHideAfterAction': True
                 }
             })
+        elif is_big_int(result):
+            summary = big_int_summary(result)
+            results.append({
+                "Title": summary['sci'],
+                "SubTitle": f'{expression} = {summary["sci"]} ({summary["digits"]} digits)',
+                "IcoPath": "icons/app.png",
+                "ContextData": {'query': query, 'x': x_fingerprint(), **summary},
+                "JsonRPCAction": {
+                    'method': 'store_big_int',
+                    'parameters': [query, x_fingerprint()],
+                    'dontHideAfterAction': False
+                }
+            })
         elif isinstance(result, int):
             fmt = f"{result:,}".replace(',', ' ')
             results.append({
@@ -250,6 +273,39 @@ class Calculator(Wox):
                         'dontHideAfterAction': False,
                     }
                 })
+        elif isinstance(result, dict):
+            # Big integer summary. The full expansions are evaluated again when copied, if x did not change.
+            query, x_token = result['query'], result['x']
+            results.append({
+                "Title": result['sci'],
+                "SubTitle": f"Normal Representation ({result['digits']} digits)",
+                "IcoPath": "Images/copy.png",
+                "JsonRPCAction": {
+                    'method': 'copy_big_int',
+                    'parameters': [query, x_token, 'dec'],
+                    'dontHideAfterAction': False,
+                }
+            })
+            results.append({
+                "Title": f"{result['hex']}...",
+                "SubTitle": f"Hexadecimal ({(result['bits'] + 3) // 4} digits)",
+                "IcoPath": "Images/copy.png",
+                "JsonRPCAction": {
+                    'method': 'copy_big_int',
+                    'parameters': [query, x_token, 'hex'],
+                    'dontHideAfterAction': False,
+                }
+            })
+            results.append({
+                "Title": f"{result['bin']}...",
+                "SubTitle": f"Binary ({result['bits']} digits)",
+                "IcoPath": "Images/copy.png",
+                "JsonRPCAction": {
+                    'method': 'copy_big_int',
+                    'parameters': [query, x_token, 'bin'],
+                    'dontHideAfterAction': False,
+                }
+            })
         elif isinstance(result, str):
             try:
                 result = complex(result)
@@ -328,12 +384,43 @@ class Calculator(Wox):
         write_to_x(result)
         self.copy_to_clipboard(result)
 
+    def evaluate_big_int(self, query, x_token):
+        # big integers are not sent through JSON, the query is evaluated again if x is the one it was shown with
+        if x_token != x_fingerprint():
+            WoxAPI.show_msg("Could not copy the result", "x changed since the result was shown", "icons/app.png")
+            return None
+        try:
+            result, _ = math_parser.evaluate(query, {'x': x})
+        except Exception as err:
+            WoxAPI.show_msg("Could not copy the result", f"{type(err).__name__}: {err}", "icons/app.png")
+            return None
+        if not is_big_int(result):
+            WoxAPI.show_msg("Could not copy the result", f"{query} is no longer a big integer", "icons/app.png")
+            return None
+        return result
+
+    def store_big_int(self, query, x_token):
+        # copy without separators and store in x after pressing enter, like smaller results
+        result = self.evaluate_big_int(query, x_token)
+        if result is not None:
+            text = int_to_decimal_str(result)
+            write_to_x(text)
+            self.copy_to_clipboard(text)
+
+    def copy_big_int(self, query, x_token, base):
+        result = self.evaluate_big_int(query, x_token)
+        if result is not None:
+            self.copy_to_clipboard(format_big_int(result, base))
+
     def copy_to_clipboard(self, text):
         if pyperclip is not None:
             pyperclip.copy(text)
         else:
             # Workaround
             cmd = 'echo ' + text.strip() + '| clip'
+            if len(cmd) > CLIP_COMMAND_LIMIT:
+                WoxAPI.show_msg("Result too long to copy", "Install pyperclip to copy long results", "icons/app.png")
+                return
             os.system(cmd)
 
 
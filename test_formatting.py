@@ -0,0 +1,73 @@
+import sys
+import unittest
+import math
+
+from formatting import BIG_INT_BITS, is_big_int, big_int_summary, int_to_decimal_str, format_big_int
+
+
+class TestBigIntFormatting(unittest.TestCase):
+
+    def setUp(self):
+        self.max_str_digits = sys.get_int_max_str_digits()
+        sys.set_int_max_str_digits(0)
+
+    def tearDown(self):
+        sys.set_int_max_str_digits(self.max_str_digits)
+
+    def _test_summary(self, value):
+        summary = big_int_summary(value)
+        digits = str(abs(value))
+        self.assertEqual(summary['digits'], len(digits))
+        self.assertEqual(summary['sci'].lstrip('-')[0], digits[0])
+        self.assertEqual(summary['sci'].lstrip('-')[2:8], digits[1:7])
+        self.assertEqual(summary['sci'].startswith('-'), value < 0)
+        self.assertTrue(hex(value).upper().startswith(summary['hex'].upper()))
+        self.assertTrue(bin(value).startswith(summary['bin']))
+
+    def test_threshold(self):
+        self.assertFalse(is_big_int(2**BIG_INT_BITS - 1))
+        self.assertTrue(is_big_int(2**BIG_INT_BITS))
+        self.assertTrue(is_big_int(-2**BIG_INT_BITS))
+        self.assertFalse(is_big_int(1e300))
+        self.assertFalse(is_big_int(True))
+
+    def test_summary(self):
+        self._test_summary(math.factorial(5000))
+        self._test_summary(2**100000)
+        self._test_summary(-3**5000)
+        self._test_summary(2 * 10**1000)
+        self._test_summary(2 * 10**1000 - 1)
+        self._test_summary(-(123 * 10**2000 - 1))
+        self.assertEqual(big_int_summary(2 * 10**1000 - 1)['sci'], '1.999999e+1000')
+        self.assertEqual(big_int_summary(2 * 10**1000)['sci'], '2.000000e+1000')
+
+    def test_summary_powers_of_10(self):
+        for k in (400, 1000, 30103):
+            for value in (10**k - 1, 10**k, 10**k + 1, -10**k, -(10**k - 1), 10**k - 10**(k - 40), 10**k + 10**(k - 40)):
+                self._test_summary(value)
+        self.assertEqual(big_int_summary(10**400)['sci'], '1.000000e+400')
+        self.assertEqual(big_int_summary(10**400 - 1)['sci'], '9.999999e+399')
+
+    def test_summary_close_to_power_of_10(self):
+        # Congruent to 5**k modulo large primes, but far enough from 10**k that the low bits do not show it
+        k = 1000
+        modulus = (2**61 - 1) * (2**89 - 1) * (2**107 - 1)
+        self._test_summary((5**k + modulus - 1) * 2**k + 2**(k - 1))
+        self._test_summary((5**k - modulus) * 2**k)
+
+    def test_decimal_conversion(self):
+        for value in (2**BIG_INT_BITS + 1, math.factorial(5000), -7**20000, 10**5000, 10**5000 - 1):
+            self.assertEqual(int_to_decimal_str(value), str(value))
+
+    def test_format_big_int(self):
+        # 2**1025 and -2**1025 have a binary form whose length is a multiple of 4
+        for value in (math.factorial(1000), -(2**5000 + 12345), 2**1025, -2**1025):
+            self.assertEqual(format_big_int(value, 'dec'), f'{value:,}'.replace(',', ' '))
+            self.assertEqual(int(format_big_int(value, 'dec').replace(' ', '')), value)
+            self.assertEqual(format_big_int(value, 'hex'), hex(value).upper().replace('0X', '0x'))
+            self.assertEqual(format_big_int(value, 'bin'), bin(value))
+        self.assertEqual(format_big_int(-2**1025, 'bin'), '-0b1' + '0' * 1025)
+
+
+if __name__ == "__main__":
+    unittest.main()